@@ -0,0 +1,98 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("gspread")
+pytest.importorskip("yt_dlp")
+
+from youtube_download_coordinator.async_coordinator import AsyncCoordinator
+from youtube_download_coordinator.config import Config
+from youtube_download_coordinator.coordinator import Coordinator
+from youtube_download_coordinator.task_manager import TaskManager
+from youtube_download_coordinator.utils.system_utils import get_machine_hostname
+
+
+HEADERS = ['ID', 'SourceID', 'URL', 'Status', 'ClaimedBy', 'ClaimedAt', 'RetryCount']
+
+
+class FakeClient:
+    """
+    A SheetClient stand-in whose Video Tasks sheet holds one pending task per
+    claim in `claims`: a task ID claimed by this machine, or a (task ID, hostname)
+    pair for a claim won by another machine. Once exhausted, the sheet is empty.
+    """
+
+    def __init__(self, claims):
+        self.config = Config(
+            credentials_file="credentials.json",
+            spreadsheet_id="spreadsheet",
+            claim_jitter_seconds=0
+        )
+        self.video_tasks_worksheet = SimpleNamespace(id=1, title='Video Tasks')
+        self._claims = iter(claims)
+        self._claimed_by = {}
+
+    def _snapshot(self, worksheet, refresh=False):
+        claim = next(self._claims, None)
+        if claim is None:
+            return [HEADERS]
+
+        task_id, claimed_by = claim if isinstance(claim, tuple) else (claim, get_machine_hostname())
+        self._claimed_by[task_id] = claimed_by
+        return [HEADERS, [task_id, 'source', f"https://www.youtube.com/watch?v={task_id}", 'pending', '', '', '0']]
+
+    def _hand_out(self, worksheet, row_id):
+        return True
+
+    def update_rows(self, worksheet, row_updates):
+        pass
+
+    def enqueue_row_update(self, worksheet, row_id, updates):
+        pass
+
+    def _get_task_by_id(self, task_id):
+        return {
+            'ID': task_id,
+            'URL': f"https://www.youtube.com/watch?v={task_id}",
+            'Status': 'in-progress',
+            'ClaimedBy': self._claimed_by[task_id]
+        }
+
+
+def make_async_coordinator(claims):
+    """
+    Builds an AsyncCoordinator around a real TaskManager backed by a FakeClient.
+    """
+
+    client = FakeClient(claims)
+
+    coordinator = Coordinator.__new__(Coordinator)
+    coordinator.config = client.config
+    coordinator.task_manager = TaskManager(client)
+    coordinator._tasks_available_until = 0
+    coordinator._ensure_tasks_are_available = lambda: None
+
+    async_coordinator = AsyncCoordinator.__new__(AsyncCoordinator)
+    async_coordinator.config = client.config
+    async_coordinator.coordinator = coordinator
+    async_coordinator._semaphore = None
+    async_coordinator._claim_lock = None
+    return async_coordinator
+
+
+def test_worker_retries_after_a_lost_claim_and_stops_when_empty():
+    coordinator = make_async_coordinator(['a', ('b', 'other-machine'), 'c', ('d', 'other-machine')])
+    processed_urls = []
+
+    async def process(url):
+        processed_urls.append(url)
+
+    # A worker that keeps polling after the queue runs dry times out here.
+    total = asyncio.run(asyncio.wait_for(coordinator.run_workers(1, process), timeout=5))
+
+    assert total == 2
+    assert processed_urls == [
+        "https://www.youtube.com/watch?v=a",
+        "https://www.youtube.com/watch?v=c",
+    ]
@@ -0,0 +1,32 @@
+from dataclasses import asdict, fields
+
+import pytest
+
+pytest.importorskip("gspread")
+pytest.importorskip("yt_dlp")
+
+from youtube_download_coordinator.config import Config
+
+
+def test_fatal_error_substrings_can_change_after_init():
+    config = Config(credentials_file="credentials.json", spreadsheet_id="spreadsheet")
+
+    assert config.is_fatal_error("ERROR: Private video")
+    assert not config.is_fatal_error("ERROR: Members-only content")
+
+    config.fatal_error_substrings.append("Members-only")
+    assert config.is_fatal_error("ERROR: Members-only content")
+
+    config.fatal_error_substrings = []
+    assert not config.is_fatal_error("ERROR: Private video")
+
+
+def test_fatal_error_matcher_is_not_part_of_the_config_fields():
+    config = Config(credentials_file="credentials.json", spreadsheet_id="spreadsheet")
+    other = Config(credentials_file="credentials.json", spreadsheet_id="spreadsheet")
+
+    assert config.is_fatal_error("ERROR: Private video")
+
+    assert config == other
+    assert not any(f.name.startswith('_fatal_error') for f in fields(Config))
+    assert not any(name.startswith('_fatal_error') for name in asdict(config))
@@ -0,0 +1,114 @@
+import threading
+
+import pytest
+
+pytest.importorskip("gspread")
+
+from youtube_download_coordinator.config import Config
+from youtube_download_coordinator.sheet_client import SheetClient
+
+
+class FakeWorksheet:
+    def __init__(self, worksheet_id, title):
+        self.id = worksheet_id
+        self.title = title
+
+
+def make_client(index, update_rows):
+    """
+    Builds a SheetClient without connecting to Google Sheets.
+    """
+
+    client = SheetClient.__new__(SheetClient)
+    client.config = Config(
+        credentials_file="credentials.json",
+        spreadsheet_id="spreadsheet",
+        status_flush_interval_seconds=60
+    )
+    client._pending_row_updates = {}
+    client._pending_row_updates_lock = threading.Lock()
+    client._flush_event = threading.Event()
+    client._flusher = object()  # Prevents the background flusher from starting.
+    client._refresh_id_index = lambda worksheet: index
+    client.update_rows = update_rows
+    return client
+
+
+def test_flush_merges_updates_to_the_same_row():
+    written = []
+    client = make_client({'a': 2, 'b': 3}, lambda worksheet, row_updates: written.append(row_updates))
+    worksheet = FakeWorksheet(1, 'Video Tasks')
+
+    client.enqueue_row_update(worksheet, 'a', {'Status': 'pending'})
+    client.enqueue_row_update(worksheet, 'b', {'Status': 'done'})
+    client.enqueue_row_update(worksheet, 'a', {'Status': 'done', 'LastError': ''})
+    client.flush_row_updates()
+
+    assert written == [[(2, {'Status': 'done', 'LastError': ''}), (3, {'Status': 'done'})]]
+    assert client._pending_row_updates == {}
+
+
+def test_flush_skips_rows_that_no_longer_exist():
+    written = []
+    client = make_client({'a': 2}, lambda worksheet, row_updates: written.append(row_updates))
+    worksheet = FakeWorksheet(1, 'Video Tasks')
+
+    client.enqueue_row_update(worksheet, 'a', {'Status': 'done'})
+    client.enqueue_row_update(worksheet, 'gone', {'Status': 'done'})
+    client.flush_row_updates()
+
+    assert written == [[(2, {'Status': 'done'})]]
+
+
+def test_failed_flush_requeues_under_newer_updates():
+    worksheet = FakeWorksheet(1, 'Video Tasks')
+
+    def failing_update_rows(worksheet, row_updates):
+        # An update queued while the flush is in flight must win over the failed one.
+        client.enqueue_row_update(worksheet, 'a', {'Status': 'pending'})
+        raise RuntimeError("API unavailable")
+
+    client = make_client({'a': 2, 'b': 3}, failing_update_rows)
+
+    client.enqueue_row_update(worksheet, 'a', {'Status': 'done', 'RetryCount': 1})
+    client.enqueue_row_update(worksheet, 'b', {'Status': 'done'})
+
+    with pytest.raises(RuntimeError):
+        client.flush_row_updates()
+
+    assert client._pending_row_updates == {
+        (1, 'a'): (worksheet, {'Status': 'pending', 'RetryCount': 1}),
+        (1, 'b'): (worksheet, {'Status': 'done'}),
+    }
+
+
+def test_zero_interval_writes_immediately():
+    written = []
+    client = make_client({}, None)
+    client.config.status_flush_interval_seconds = 0
+    client.update_row = lambda worksheet, row_id, updates: written.append((row_id, updates))
+
+    client.enqueue_row_update(FakeWorksheet(1, 'Video Tasks'), 'a', {'Status': 'done'})
+
+    assert written == [('a', {'Status': 'done'})]
+    assert client._pending_row_updates == {}
+
+
+def test_rows_are_handed_out_once_per_ttl():
+    client = make_client({}, None)
+    client.config.snapshot_ttl_seconds = 60
+    client._handed_out = {}
+    client._handed_out_lock = threading.Lock()
+    worksheet = FakeWorksheet(1, 'Video Tasks')
+
+    assert client._hand_out(worksheet, 'a')
+    assert not client._hand_out(worksheet, 'a')
+    assert client._hand_out(worksheet, 'b')
+    assert client._hand_out(FakeWorksheet(2, 'Sources'), 'a')
+
+
+def test_only_numeric_columns_are_written_as_numbers():
+    assert SheetClient._to_extended_value('123456789e1', 'ID') == {'stringValue': '123456789e1'}
+    assert SheetClient._to_extended_value('1_000', 'URL') == {'stringValue': '1_000'}
+    assert SheetClient._to_extended_value('3', 'RetryCount') == {'numberValue': 3.0}
+    assert SheetClient._to_extended_value('', 'Duration') == {'stringValue': ''}
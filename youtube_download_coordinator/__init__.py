@@ -1,2 +1,3 @@
-from .config import Config              # noqa: F401
-from .coordinator import Coordinator    # noqa: F401
\ No newline at end of file
+from .config import Config                          # noqa: F401
+from .coordinator import Coordinator                # noqa: F401
+from .async_coordinator import AsyncCoordinator     # noqa: F401
\ No newline at end of file
@@ -1,28 +1,73 @@
 import hashlib
+import io
 import logging
-import time
+import os
 from pathlib import Path
-from typing import Set
+from typing import IO, Dict, List, Optional, Set, Tuple
 
 from .sheet_client import SheetClient
 
 logger = logging.getLogger(__name__)
 
 
+def _fadvise(f: IO, advice_name: str):
+    """Pass an access-pattern hint to the kernel where posix_fadvise is supported."""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, advice)
+    except OSError:
+        pass
+
+
 def calculate_file_hash(file_path: str) -> str:
     """Calculate SHA256 hash of a file."""
-    h = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        _fadvise(f, "POSIX_FADV_SEQUENTIAL")
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 18), b""):
             h.update(chunk)
-    return h.hexdigest()
+        return h.hexdigest()
+
+
+def get_file_stat_token(file_path: str) -> str:
+    """Build a cheap change-detection token from a file's mtime and size."""
+    st = os.stat(file_path)
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _read_hash_state(hash_file: str) -> Tuple[str, str]:
+    """Read the stored (stat token, digest) pair, tolerating missing or legacy files."""
+    try:
+        with open(hash_file, "r", encoding="utf-8") as f:
+            lines = f.read().split()
+    except FileNotFoundError:
+        return "", ""
+
+    if len(lines) >= 2:
+        return lines[0], lines[1]
+    if len(lines) == 1:
+        return "", lines[0]
+    return "", ""
 
 
-def import_sources_from_file(file_path: str, client: SheetClient):
+def _write_hash_state(hash_file: str, stat_token: str, file_hash: str):
+    """Atomically persist the (stat token, digest) pair."""
+    tmp = Path(hash_file + ".tmp")
+    tmp.write_text(f"{stat_token}\n{file_hash}\n", encoding="utf-8")
+    os.replace(tmp, hash_file)
+
+
+def import_sources_from_file(file_path: str, client: SheetClient, *, expected_columns: Optional[int] = None):
     """
     Reads a text file to add new sources to the Google Sheet.
     Only runs if the file has changed since the last run (tracked in client.config.hash_file).
     Safely ensures the file exists before processing.
+    If expected_columns is set, lines with a different number of '|'-separated columns are skipped.
     """
     file_path_obj = Path(file_path)
     file_path_obj.parent.mkdir(parents=True, exist_ok=True)  
@@ -32,64 +77,79 @@ def import_sources_from_file(file_path: str, client: SheetClient):
         file_path_obj.touch()
 
     try:
-        file_hash = calculate_file_hash(file_path)
+        stat_token = get_file_stat_token(file_path)
         hash_file = client.config.hash_file
 
-        hash_file_obj = Path(hash_file)
-        hash_file_obj.parent.mkdir(parents=True, exist_ok=True)
-        
-        if not hash_file_obj.exists():
-            hash_file_obj.touch()
+        Path(hash_file).parent.mkdir(parents=True, exist_ok=True)
+
+        last_token, last_hash = _read_hash_state(hash_file)
+
+        if last_token == stat_token:
+            logger.info("No changes detected in '%s'. Skipping import.", file_path)
+            return
 
-        try:
-            with open(hash_file, "r", encoding="utf-8") as f:
-                last_hash = f.read().strip()
-        except FileNotFoundError:
-            last_hash = ""
+        file_hash = calculate_file_hash(file_path)
 
         if last_hash == file_hash:
             logger.info("No changes detected in '%s'. Skipping import.", file_path)
+            _write_hash_state(hash_file, stat_token, file_hash)
             return
         else:
             logger.info("Change detected in '%s'. Proceeding with import.", file_path)
 
         logger.info("Fetching existing sources to avoid duplicates...")
-        existing_sources = client.get_sources()
-        existing_urls: Set[str] = {source.get("URL", "").strip() for source in existing_sources}
+        existing_urls: Set[str] = client.get_source_urls()
         logger.info("Found %d existing sources.", len(existing_urls))
 
-        sources_added_count = 0
+        pending_sources: Dict[str, Optional[str]] = {}
         sources_skipped_count = 0
-
-        with open(file_path, "r", encoding="utf-8") as f:
-            for i, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-
-                parts = [part.strip() for part in line.split("|")]
-                if not parts or not parts[0]:
-                    logger.warning("Skipping line %d as it's empty or missing a URL.", i)
-                    continue
-
-                url = parts[0]
-                if url in existing_urls:
-                    logger.info("Skipping duplicate URL: %s", url)
-                    sources_skipped_count += 1
-                else:
-                    logger.info("Adding new source: %s", url)
-                    client.add_source(*parts)
-                    existing_urls.add(url)
-                    sources_added_count += 1
-                    time.sleep(client.config.api_wait_seconds)
+        log_debug = logger.isEnabledFor(logging.DEBUG)
+        skipped_urls: List[str] = []
+
+        with open(file_path, "rb", buffering=1 << 20) as raw:
+            _fadvise(raw, "POSIX_FADV_SEQUENTIAL")
+            try:
+                f = io.TextIOWrapper(raw, encoding="utf-8")
+                for i, line in enumerate(f, 1):
+                    url, sep, rest = line.partition("|")
+                    url = url.strip()
+                    if not url:
+                        if sep:
+                            logger.warning("Skipping line %d as it's empty or missing a URL.", i)
+                        continue
+
+                    if expected_columns is not None and line.count("|") + 1 != expected_columns:
+                        logger.warning("Skipping line %d as it does not have %d columns.", i, expected_columns)
+                        continue
+
+                    if url in existing_urls or url in pending_sources:
+                        if log_debug:
+                            skipped_urls.append(url)
+                        sources_skipped_count += 1
+                        continue
+
+                    pending_sources[url] = rest if sep else None
+            finally:
+                _fadvise(raw, "POSIX_FADV_DONTNEED")
+
+        new_rows: List[List[str]] = [
+            [url] + ([part.strip() for part in rest.split("|")] if rest is not None else [])
+            for url, rest in pending_sources.items()
+        ]
+
+        if new_rows:
+            client.add_sources_bulk(new_rows)
 
         summary_message = (
-            f"Import Summary: {sources_added_count} sources added, {sources_skipped_count} duplicates skipped."
+            f"Import Summary: {len(new_rows)} sources added, {sources_skipped_count} duplicates skipped."
         )
         logger.info(summary_message)
 
-        with open(hash_file, "w", encoding="utf-8") as f:
-            f.write(file_hash)
+        if log_debug:
+            logger.debug("Added sources: %s", list(pending_sources))
+            logger.debug("Skipped duplicate sources: %s", skipped_urls)
+
+        _write_hash_state(hash_file, stat_token, file_hash)
 
     except Exception:
         logger.exception("An unexpected error occurred while importing from '%s'", file_path)
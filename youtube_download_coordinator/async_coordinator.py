@@ -0,0 +1,154 @@
+import asyncio
+import functools
+import logging
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from .config import Config
+from .coordinator import Coordinator
+from .video_task import VideoTask
+
+logger = logging.getLogger(__name__)
+
+# Outcomes of a single claim-and-process cycle.
+_PROCESSED = 'processed'
+_LOST_CLAIM = 'lost-claim'
+_NO_TASKS = 'no-tasks'
+
+
+class AsyncCoordinator:
+    """
+    Runs several task-processing loops concurrently on top of a Coordinator.
+
+    The blocking Google Sheets calls are executed in a thread pool, bounded by
+    `concurrent_requests`, so that network latency overlaps with the user's
+    processing coroutines. Claims are serialized within the process so that two
+    local workers, which share the same hostname, never claim the same task.
+    """
+
+    def __init__(self, config: Config):
+        """Initializes the underlying synchronous Coordinator."""
+
+        self.config = config
+        self.coordinator = Coordinator(config)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._claim_lock: Optional[asyncio.Lock] = None
+        logger.info("AsyncCoordinator initialized.")
+
+
+    def _ensure_primitives(self):
+        """
+        Lazily creates the asyncio primitives inside the running event loop.
+        """
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.config.concurrent_requests)
+        if self._claim_lock is None:
+            self._claim_lock = asyncio.Lock()
+
+
+    async def _run_blocking(self, func: Callable[..., Any], *args) -> Any:
+        """
+        Runs a blocking call in the default executor, bounded by the request semaphore.
+        """
+
+        self._ensure_primitives()
+        loop = asyncio.get_running_loop()
+
+        async with self._semaphore:
+            return await loop.run_in_executor(None, functools.partial(func, *args))
+
+
+    def _claim_next_task(self) -> Tuple[Optional[VideoTask], bool]:
+        """
+        Performs the source expansion and claim steps of a task cycle.
+
+        Returns:
+            Tuple[Optional[VideoTask], bool]: The claimed task, if any, and whether the
+            claim was lost to another machine.
+        """
+
+        self.coordinator._ensure_tasks_are_available()
+        return self.coordinator._claim_next_task()
+
+
+    async def _process_next(self, processing_coro: Callable[[str], Awaitable[None]]) -> str:
+        """
+        Claims the next available task and awaits the processing coroutine.
+
+        Returns:
+            str: _PROCESSED, _LOST_CLAIM if another machine claimed the task first,
+            or _NO_TASKS if no tasks were available.
+        """
+
+        self._ensure_primitives()
+
+        async with self._claim_lock:
+            task, lost_claim = await self._run_blocking(self._claim_next_task)
+
+        if not task:
+            return _LOST_CLAIM if lost_claim else _NO_TASKS
+
+        task_manager = self.coordinator.task_manager
+
+        try:
+            logger.info("Delivering task ID: %s | URL: %s", task.id, task.url)
+            await processing_coro(task.url)
+            logger.info("Processing coroutine successfully completed for task ID %s.", task.id)
+            await self._run_blocking(task_manager.mark_task_as_done, task)
+
+        except Exception as e:
+            logger.exception("Processing coroutine failed for task ID %s.", task.id)
+            await self._run_blocking(task_manager.mark_task_as_error, task, str(e))
+
+        return _PROCESSED
+
+
+    async def process_next_task_async(self, processing_coro: Callable[[str], Awaitable[None]]) -> bool:
+        """
+        Claims the next available task and awaits the processing coroutine.
+
+        Args:
+            processing_coro (Callable[[str], Awaitable[None]]): A coroutine function that processes the task's URL.
+
+        Returns:
+            bool: True if a task was successfully processed, False if no task was processed
+            (none were available, or the claim was lost to another machine).
+        """
+
+        return await self._process_next(processing_coro) == _PROCESSED
+
+
+    async def _worker_loop(self, worker_index: int, processing_coro: Callable[[str], Awaitable[None]]) -> int:
+        """
+        Processes tasks until none are available and returns how many were handled.
+        A claim lost to another machine is retried rather than ending the loop.
+        """
+
+        processed = 0
+        while True:
+            outcome = await self._process_next(processing_coro)
+
+            if outcome == _NO_TASKS:
+                break
+            if outcome == _PROCESSED:
+                processed += 1
+
+        logger.info("Async worker %d finished after processing %d tasks.", worker_index, processed)
+        return processed
+
+
+    async def run_workers(self, n: int, processing_coro: Callable[[str], Awaitable[None]]) -> int:
+        """
+        Launches `n` concurrent processing loops sharing one client.
+
+        Returns:
+            int: The total number of tasks processed by all workers.
+        """
+
+        if n < 1:
+            raise ValueError("run_workers requires at least one worker.")
+
+        results = await asyncio.gather(
+            *(self._worker_loop(i, processing_coro) for i in range(n))
+        )
+        return sum(results)
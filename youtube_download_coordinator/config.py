@@ -1,6 +1,13 @@
+import re
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Optional, List, Pattern, Tuple
+
+try:
+    import ahocorasick_rs
+except ImportError:  # Optional speed-up, see the 'fast' extra.
+    ahocorasick_rs = None
 
 
 @dataclass
@@ -14,7 +21,13 @@ class Config:
     sources_file_path: Optional[str] = None
     results_dir: str = 'results'
     selected_dir: str = 'selected'
+    results_lock_timeout_seconds: float = 300
     api_wait_seconds: float = 1.0
+    api_burst_size: int = 10
+    api_max_retries: int = 7
+    api_max_backoff_seconds: float = 64.0
+    snapshot_ttl_seconds: float = 5.0
+    http_pool_size: int = 20
 
     # --- Worksheet Names ---
     sources_worksheet_name: str = 'Sources'
@@ -34,8 +47,16 @@ class Config:
     claim_jitter_seconds: int = 5
     stalled_task_timeout_minutes: int = 60
     max_retries: int = 3
-    video_task_batch_size: int = 25
+    video_task_batch_size: int = 4000
+    source_import_batch_size: int = 500
+    max_cells_per_request: int = 40000
+    expand_full_metadata: bool = False
+    expand_workers: int = 8
     health_check_interval_seconds: int = 60 # New health check interval
+    tasks_available_cache_seconds: int = 30
+    concurrent_requests: int = 4
+    status_flush_interval_seconds: float = 0
+    status_flush_max_batch: int = 100
     
     # --- Error Handling ---
     fatal_error_substrings: List[str] = field(default_factory=lambda: [
@@ -56,7 +77,54 @@ class Config:
     hash_file: str = field(init=False)
 
     def __post_init__(self):
+        if self.api_wait_seconds < 0:
+            raise ValueError("api_wait_seconds must be >= 0 (0 disables rate limiting).")
+
+        # Interned so that comparisons against interned sheet values hit the identity fast path.
+        for name in ('STATUS_PENDING', 'STATUS_IN_PROGRESS', 'STATUS_DONE', 'STATUS_ERROR', 'STATUS_ACTIVE'):
+            setattr(self, name, sys.intern(getattr(self, name)))
+
         base_dir = Path(__file__).resolve().parent
         hashes_dir = base_dir / "hashes"
         hashes_dir.mkdir(parents=True, exist_ok=True)
-        self.hash_file = str(hashes_dir / "sources_hash.txt")
\ No newline at end of file
+        self.hash_file = str(hashes_dir / "sources_hash.txt")
+
+        # Matcher for fatal_error_substrings, rebuilt whenever the list changes. Plain
+        # attributes rather than fields, so they stay out of __eq__, fields() and asdict().
+        self._fatal_error_key: Optional[Tuple[str, ...]] = None
+        self._fatal_error_pattern: Optional[Pattern[str]] = None
+        self._fatal_error_automaton: Optional[Any] = None
+
+    def _build_fatal_error_matcher(self):
+        """
+        Compiles fatal_error_substrings if it changed since the matcher was last built.
+        """
+        key = tuple(self.fatal_error_substrings)
+        if key == self._fatal_error_key:
+            return
+
+        self._fatal_error_pattern = None
+        self._fatal_error_automaton = None
+
+        if key and ahocorasick_rs is not None:
+            self._fatal_error_automaton = ahocorasick_rs.AhoCorasick(list(key))
+        elif key:
+            self._fatal_error_pattern = re.compile("|".join(map(re.escape, key)))
+
+        self._fatal_error_key = key
+
+    def is_fatal_error(self, error_message: str) -> bool:
+        """
+        Returns True if the error message contains any of the fatal error substrings.
+        Uses an Aho-Corasick automaton when ahocorasick_rs is installed, which scans
+        the message once regardless of the number of substrings. The matcher is
+        compiled on first use and again whenever fatal_error_substrings changes.
+        """
+        self._build_fatal_error_matcher()
+
+        if self._fatal_error_automaton is not None:
+            return bool(self._fatal_error_automaton.find_matches_as_indexes(error_message))
+
+        if self._fatal_error_pattern is None:
+            return False
+        return self._fatal_error_pattern.search(error_message) is not None
@@ -1,13 +1,17 @@
+import errno
 import logging
+import os
+import threading
 import time
-from typing import Callable, List
+from typing import Callable, List, Tuple, Union
 from pathlib import Path
 import shutil
-from filelock import FileLock
+from filelock import FileLock, Timeout
 
 from .sheet_client import SheetClient
 from .source_manager import SourceManager
 from .task_manager import TaskManager
+from .video_task import VideoTask
 from .config import Config
 from .add_sources import import_sources_from_file
 from .utils.system_utils import get_machine_hostname
@@ -15,6 +19,25 @@ from .utils.system_utils import get_machine_hostname
 logger = logging.getLogger(__name__)
 
 
+def _fast_move(src: Path, dst: Path):
+    """
+    Moves a path with a single rename, falling back to shutil.move when the
+    destination already exists or lies on another filesystem.
+    """
+
+    if dst.exists():
+        shutil.move(str(src), str(dst))
+        return
+
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno == errno.EXDEV:
+            shutil.move(str(src), str(dst))
+        else:
+            raise
+
+
 class Coordinator:
     """
     Manages a distributed task queue using Google Sheets.
@@ -28,33 +51,63 @@ class Coordinator:
         self.source_manager = SourceManager(self.client)
         self.task_manager = TaskManager(self.client)
         self.sources_file_path = config.sources_file_path
-        self.last_health_check_time = 0
+        self.hostname = get_machine_hostname()
+        self._tasks_available_until = 0
+
+        self._health_stop_event = threading.Event()
+        self._health_thread = threading.Thread(target=self._health_loop, name="health-check", daemon=True)
+        self._health_thread.start()
+
         logger.info("Coordinator initialized.")
 
 
-    def _perform_health_check(self):
+    def _health_loop(self):
         """
-        Updates the worker's status in the spreadsheet to show it's active.
+        Periodically updates the worker's status in the spreadsheet to show it's active.
+        Runs in a background daemon thread until `stop_health_check` is called.
         """
-        
-        now = time.monotonic()
-        if (now - self.last_health_check_time) > self.config.health_check_interval_seconds:
+
+        while not self._health_stop_event.is_set():
             logger.info("Performing health check...")
-            hostname = get_machine_hostname()
-            self.client.update_worker_status(hostname, self.config.STATUS_ACTIVE)
-            self.last_health_check_time = now
+            self.client.update_worker_status(self.hostname, self.config.STATUS_ACTIVE)
+            self._health_stop_event.wait(self.config.health_check_interval_seconds)
+
+
+    def stop_health_check(self):
+        """
+        Stops the background health check thread.
+        """
+
+        self._health_stop_event.set()
+        self._health_thread.join(timeout=self.config.health_check_interval_seconds)
 
 
     def _ensure_tasks_are_available(self):
         """
         Checks if there are pending tasks and attempts to expand sources if none are found.
         """
-        
+
+        if time.monotonic() < self._tasks_available_until:
+            return
+
+        self._flush_status_updates()
+
         if not self.client.find_next_pending_task():
             logger.info("No pending video tasks found. Checking for new sources to expand...")
             self._run_source_expansion_phase()
 
 
+    def _flush_status_updates(self):
+        """
+        Writes this process's queued status updates before a read that depends on them.
+        """
+
+        try:
+            self.client.flush_row_updates()
+        except Exception as e:
+            logger.error(f"Failed to flush queued status updates: {e}")
+
+
     def _import_sources(self):
         """Imports new sources from the file specified in the configuration."""
         
@@ -87,6 +140,27 @@ class Coordinator:
         self.source_manager.process_source_expansion(source)
         
 
+    def _claim_next_task(self) -> Tuple[Union[VideoTask, None], bool]:
+        """
+        Claims the next video task and updates the task-availability cache.
+
+        Returns:
+            Tuple[Union[VideoTask, None], bool]: The claimed task, if any, and whether the
+            claim was lost to another machine.
+        """
+
+        logger.info("--- Attempting to claim a video task ---")
+        task, lost_claim = self.task_manager.claim_next_task()
+
+        if not task:
+            logger.info("No pending video tasks available at the moment.")
+            self._tasks_available_until = 0
+            return None, lost_claim
+
+        self._tasks_available_until = time.monotonic() + self.config.tasks_available_cache_seconds
+        return task, False
+
+
     def process_next_task(self, processing_function: Callable[[str], None]) -> bool:
         """
         Claims the next available task and executes the processing function.
@@ -98,14 +172,11 @@ class Coordinator:
             bool: True if a task was successfully processed, False if no tasks were available.
         """
         
-        self._perform_health_check()
         self._ensure_tasks_are_available()
 
-        logger.info("--- Attempting to claim a video task ---")
-        task = self.task_manager.get_next_task()
+        task, _ = self._claim_next_task()
 
         if not task:
-            logger.info("No pending video tasks available at the moment.")
             return False
 
         try:
@@ -128,22 +199,16 @@ class Coordinator:
         """
 
         logger.info(f"Fetching results for source ID: {source_id}")
-        tasks = self.client.get_tasks_by_source_id(source_id)
-        
-        done_tasks = [
-            task for task in tasks 
-            if task.get('Status') == self.config.STATUS_DONE and task.get('ClaimedBy') == get_machine_hostname()
-        ]
+        self._flush_status_updates()
+        done_task_ids = self.client.get_done_tasks_for(source_id, self.hostname)
 
         results_path = Path(self.config.results_dir)
         results_path.mkdir(exist_ok=True)
 
-        result_folders = []
-        for task in done_tasks:
-            task_id = str(task.get('ID'))
-            task_folder = results_path / task_id
-            if task_folder.is_dir():
-                result_folders.append(task_folder)
+        with os.scandir(results_path) as entries:
+            dir_names = {entry.name for entry in entries if entry.is_dir()}
+
+        result_folders = [results_path / task_id for task_id in done_task_ids if task_id in dir_names]
         
         logger.info(f"Found {len(result_folders)} result folders for source ID {source_id} on this machine.")
         return result_folders
@@ -152,6 +217,10 @@ class Coordinator:
     def manage_results(self, source_id: str = None):
         """
         Atomically moves result folders to a destination directory and back.
+
+        Raises:
+            filelock.Timeout: If the results lock cannot be acquired within
+                `results_lock_timeout_seconds`. Nothing is moved in that case.
         """
 
         dest_path = Path(self.config.selected_dir)
@@ -160,15 +229,20 @@ class Coordinator:
         results_path = Path(self.config.results_dir)
         lock_path = Path(".results.lock")
 
-        with FileLock(lock_path):
-            for item in dest_path.iterdir():
-                if item.is_dir():
-                    shutil.move(str(item), str(results_path / item.name))
-                    logger.info(f"Moved back {item.name} to results.")
-
-            if source_id:
-                folders_to_move = self._get_result_folders_by_source_id(source_id)
-
-                for folder in folders_to_move:
-                    shutil.move(str(folder), str(dest_path / folder.name))
-                    logger.info(f"Moved {folder.name} to {dest_path}.")
\ No newline at end of file
+        try:
+            with FileLock(lock_path, timeout=self.config.results_lock_timeout_seconds):
+                for item in dest_path.iterdir():
+                    if item.is_dir():
+                        _fast_move(item, results_path / item.name)
+                        logger.info(f"Moved back {item.name} to results.")
+
+                if source_id:
+                    folders_to_move = self._get_result_folders_by_source_id(source_id)
+
+                    for folder in folders_to_move:
+                        _fast_move(folder, dest_path / folder.name)
+                        logger.info(f"Moved {folder.name} to {dest_path}.")
+
+        except Timeout:
+            logger.error(f"Could not acquire results lock '{lock_path}' within {self.config.results_lock_timeout_seconds} seconds.")
+            raise
\ No newline at end of file
@@ -1,16 +1,36 @@
 import gspread
 from gspread import Worksheet
 from gspread.exceptions import APIError, SpreadsheetNotFound, WorksheetNotFound
+from gspread.utils import rowcol_to_a1
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up, see the 'fast' extra.
+    orjson = None
+
+import atexit
 import logging
+import math
+import random
+import sys
+import threading
 import time
-from typing import List, Dict, Union
+from itertools import zip_longest
+from typing import Callable, Iterator, List, Dict, Set, Tuple, TypeVar, Union
 
 from .config import Config
 from .utils.time_utils import get_current_timestamp
+from .utils.rate_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# Columns whose values are written as numbers when rows are copied cell by cell.
+_NUMERIC_COLUMNS = frozenset({'Duration', 'RetryCount'})
+
 
 class SheetClient:
     """
@@ -28,12 +48,31 @@ class SheetClient:
 
         self.config = config
         
-        self.api_wait_seconds: float = config.api_wait_seconds
-        self.last_api_call_time: float = 0
+        self._header_cache: Dict[int, Tuple[List[str], Dict[str, int]]] = {}
+        self._snapshot_cache: Dict[int, Tuple[float, List[List[str]]]] = {}
+        self._id_index: Dict[int, Dict[str, int]] = {}
+        self._handed_out: Dict[Tuple[int, str], float] = {}
+        self._handed_out_lock = threading.Lock()
+
+        self._pending_row_updates: Dict[Tuple[int, str], Tuple[Worksheet, Dict[str, str]]] = {}
+        self._pending_row_updates_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._flusher: Union[threading.Thread, None] = None
+
+        # An api_wait_seconds of 0 disables rate limiting.
+        self._limiter: Union[TokenBucket, None] = None
+        if config.api_wait_seconds > 0:
+            self._limiter = TokenBucket(
+                capacity=config.api_burst_size,
+                refill_per_sec=1.0 / config.api_wait_seconds
+            )
 
         try:
             gc = gspread.service_account(filename=config.credentials_file)
+            self._configure_session(gc)
+            self._install_fast_json(gc)
             spreadsheet = gc.open_by_key(config.spreadsheet_id)
+            self.spreadsheet = spreadsheet
 
             self.sources_worksheet: Worksheet = spreadsheet.worksheet(config.sources_worksheet_name)
             self.video_tasks_worksheet: Worksheet = spreadsheet.worksheet(config.video_tasks_worksheet_name)
@@ -46,8 +85,6 @@ class SheetClient:
             except WorksheetNotFound:
                 logger.warning(f"Worksheet '{config.workers_worksheet_name}' not found. Please create it.")
 
-            self.last_api_call_time = time.monotonic()
-
             logger.info("Successfully connected to Google Sheets.")
 
         except FileNotFoundError:
@@ -66,18 +103,124 @@ class SheetClient:
             )
 
 
+    def _configure_session(self, gc: gspread.Client):
+        """
+        Mounts a larger keep-alive connection pool on the client's authorized session,
+        so that concurrent calls reuse TCP/TLS connections instead of opening new ones.
+
+        Connection errors and 5xx answers to idempotent requests are retried at the
+        transport level; HTTP 429 is left to `_call`, which honours Retry-After.
+        """
+
+        retries = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=self.config.http_pool_size,
+            max_retries=retries
+        )
+        gc.http_client.session.mount('https://', adapter)
+
+
+    @staticmethod
+    def _install_fast_json(gc: gspread.Client):
+        """
+        Makes API responses parse their JSON bodies with orjson, when it is installed.
+        """
+
+        if orjson is None:
+            return
+
+        def use_orjson(response, *args, **kwargs):
+            response.json = lambda **_: orjson.loads(response.content)
+            return response
+
+        gc.http_client.session.hooks['response'].append(use_orjson)
+        logger.debug("Using orjson to parse Google Sheets API responses.")
+
+
     def _wait_for_api(self):
         """
-        Ensures a minimum wait time between consecutive API calls to avoid rate limiting.
+        Acquires a token from the shared rate limiter before an API call.
+        Safe to call from multiple threads.
+        """
+
+        if self._limiter is None:
+            return
+
+        waited = self._limiter.acquire()
+        if waited:
+            logger.debug(f"Rate limiting: waited {waited:.2f} seconds.")
+
+
+    @staticmethod
+    def _get_retry_after(error: APIError) -> Union[float, None]:
+        """
+        Returns the Retry-After delay of a rate-limited (HTTP 429) response, 0 if the
+        header is missing, or None if the error is not a rate-limit error.
+        """
+
+        response = getattr(error, 'response', None)
+        if response is None or response.status_code != 429:
+            return None
+
+        try:
+            return float(response.headers.get('Retry-After', 0))
+        except (TypeError, ValueError):
+            return 0.0
+
+
+    def _call(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Executes a gspread call through the rate limiter.
+
+        If the API answers with HTTP 429, all calls are paused and this call is
+        retried with exponential backoff and jitter, up to `api_max_retries` times.
+        """
+
+        attempt = 0
+        while True:
+            self._wait_for_api()
+            try:
+                return func(*args, **kwargs)
+
+            except APIError as e:
+                retry_after = self._get_retry_after(e)
+                if retry_after is None or attempt >= self.config.api_max_retries:
+                    raise
+
+                backoff = min(self.config.api_max_backoff_seconds, 2 ** attempt) + random.random()
+                delay = max(backoff, retry_after)
+                attempt += 1
+
+                logger.warning(
+                    f"Rate limit exceeded. Retrying in {delay:.2f} seconds "
+                    f"(attempt {attempt}/{self.config.api_max_retries})."
+                )
+                if self._limiter is None:
+                    time.sleep(delay)
+                else:
+                    self._limiter.pause(delay)
+
+
+    def _get_headers(self, worksheet: Worksheet) -> Tuple[List[str], Dict[str, int]]:
         """
+        Returns the header row of a worksheet and a map from header to 1-based column index.
 
-        elapsed = time.monotonic() - self.last_api_call_time
+        Headers are read once per worksheet and cached, since the header row is never
+        written by this client.
+        """
 
-        if elapsed < self.api_wait_seconds:
-            sleep_duration = self.api_wait_seconds - elapsed
-            logger.debug(f"Rate limiting: sleeping for {sleep_duration:.2f} seconds.")
-            time.sleep(sleep_duration)
-        self.last_api_call_time = time.monotonic()
+        cached = self._header_cache.get(worksheet.id)
+        if cached is None:
+            headers = self._call(worksheet.row_values, 1)
+            cached = (headers, {header: i + 1 for i, header in enumerate(headers)})
+            self._header_cache[worksheet.id] = cached
+        return cached
 
 
     def update_worker_status(self, hostname: str, status: str):
@@ -90,18 +233,17 @@ class SheetClient:
             return
 
         try:
-            self._wait_for_api()
-            worker_cell = self.workers_worksheet.find(hostname, in_column=1)
+            worker_cell = self._call(self.workers_worksheet.find, hostname, in_column=1)
 
             timestamp = get_current_timestamp()
 
             if worker_cell:
-                self.workers_worksheet.update_cell(worker_cell.row, 2, timestamp)
-                self.workers_worksheet.update_cell(worker_cell.row, 3, status)
+                self._call(self.workers_worksheet.update_cell, worker_cell.row, 2, timestamp)
+                self._call(self.workers_worksheet.update_cell, worker_cell.row, 3, status)
                 logger.info(f"Updated worker '{hostname}' status to '{status}'.")
 
             else:
-                self.workers_worksheet.append_row([hostname, timestamp, status])
+                self._call(self.workers_worksheet.append_row, [hostname, timestamp, status])
                 logger.info(f"Registered new worker '{hostname}' with status '{status}'.")
 
         except APIError as e:
@@ -115,41 +257,235 @@ class SheetClient:
         """
         Retrieves all records from the Sources worksheet.
         """
-        self._wait_for_api() 
-        return self.sources_worksheet.get_all_records()
+        return self._call(self.sources_worksheet.get_all_records)
     
 
+    def get_source_urls(self) -> Set[str]:
+        """
+        Retrieves the set of URLs in the Sources worksheet by reading only the URL column.
+        """
+        url_col_index = self._get_headers(self.sources_worksheet)[1]['URL']
+
+        url_values = self._call(self.sources_worksheet.col_values, url_col_index)[1:]
+
+        return {url.strip() for url in url_values if url}
+
+
     def get_video_tasks(self) -> List[Dict]:
         """
         Retrieves all records from the Video Tasks worksheet.
         """
-        self._wait_for_api()
-        return self.video_tasks_worksheet.get_all_records()
+        return self._call(self.video_tasks_worksheet.get_all_records)
     
 
-    def find_next_pending_source(self) -> Union[Dict, None]:
+    def _snapshot(self, worksheet: Worksheet, refresh: bool = False) -> List[List[str]]:
         """
-        Finds the first row in the sources worksheet with a 'pending' status.
+        Returns all values of a worksheet from a single read, cached for
+        `snapshot_ttl_seconds` or until this client writes to the worksheet.
+        Pass `refresh=True` to bypass the cache.
         """
 
-        self._wait_for_api()
+        cached = self._snapshot_cache.get(worksheet.id)
+        now = time.monotonic()
 
-        try:
-            status_col_index = self.sources_worksheet.row_values(1).index('Status') + 1
+        if not refresh and cached is not None and now - cached[0] < self.config.snapshot_ttl_seconds:
+            return cached[1]
 
-            self._wait_for_api()
-            pending_cells = self.sources_worksheet.findall(self.config.STATUS_PENDING, in_column=status_col_index)
+        rows = self._call(worksheet.get_all_values)
+        self._intern_statuses(rows)
+        self._snapshot_cache[worksheet.id] = (now, rows)
 
-            if not pending_cells:
-                return None
+        if rows and worksheet.id not in self._header_cache:
+            headers = rows[0]
+            self._header_cache[worksheet.id] = (headers, {header: i + 1 for i, header in enumerate(headers)})
 
-            first_pending_cell = pending_cells[0]
+        return rows
 
-            self._wait_for_api()
-            row_values = self.sources_worksheet.row_values(first_pending_cell.row)
-            headers = self.sources_worksheet.row_values(1)
-            
-            return dict(zip(headers, row_values))
+
+    @staticmethod
+    def _intern_statuses(rows: List[List[str]]):
+        """
+        Interns the 'Status' cells of a snapshot in place. The few distinct statuses
+        then share one object each, and equality checks against the interned
+        STATUS_* constants reduce to a pointer comparison.
+        """
+
+        if not rows or 'Status' not in rows[0]:
+            return
+
+        status_index = rows[0].index('Status')
+        intern = sys.intern
+
+        for row in rows[1:]:
+            if len(row) > status_index:
+                row[status_index] = intern(row[status_index])
+
+
+    def _invalidate_snapshot(self, worksheet: Worksheet):
+        """
+        Drops the cached snapshot of a worksheet after a write.
+        """
+
+        self._snapshot_cache.pop(worksheet.id, None)
+
+
+    def _refresh_id_index(self, worksheet: Worksheet) -> Dict[str, int]:
+        """
+        Rebuilds the ID -> row number index of a worksheet from a read of its ID column.
+        """
+
+        _, header_map = self._get_headers(worksheet)
+        id_values = self._call(worksheet.col_values, header_map['ID'])
+
+        index = {str(value): row for row, value in enumerate(id_values, 1) if row > 1 and value != ''}
+        self._id_index[worksheet.id] = index
+        return index
+
+
+    def _remove_from_id_index(self, worksheet: Worksheet, row_index: int):
+        """
+        Updates the ID index of a worksheet after the given row was deleted.
+        """
+
+        index = self._id_index.get(worksheet.id)
+        if index is None:
+            return
+
+        self._id_index[worksheet.id] = {
+            row_id: (row - 1 if row > row_index else row)
+            for row_id, row in index.items() if row != row_index
+        }
+
+
+    def _find_row_by_id(self, worksheet: Worksheet, row_id: str) -> Tuple[int, Union[List[str], None]]:
+        """
+        Locates a row by its 'ID' and returns its row number and current values,
+        or (-1, None) if it does not exist.
+
+        The cached ID index is tried first and verified against the row that is read,
+        since other workers may have inserted or deleted rows; on a mismatch the index
+        is rebuilt.
+        """
+
+        row_id = str(row_id)
+        _, header_map = self._get_headers(worksheet)
+        id_position = header_map['ID'] - 1
+
+        def matches(values: List[str]) -> bool:
+            return len(values) > id_position and str(values[id_position]) == row_id
+
+        row_index = self._id_index.get(worksheet.id, {}).get(row_id)
+        if row_index is not None:
+            row_values = self._call(worksheet.row_values, row_index)
+            if matches(row_values):
+                return row_index, row_values
+
+        row_index = self._refresh_id_index(worksheet).get(row_id)
+        if row_index is None:
+            return -1, None
+
+        row_values = self._call(worksheet.row_values, row_index)
+        if not matches(row_values):
+            return -1, None
+        return row_index, row_values
+
+
+    def _get_record_by_id(self, worksheet: Worksheet, row_id: str) -> Union[Dict, None]:
+        """
+        Retrieves a single row as a header -> value dictionary by its 'ID'.
+        """
+
+        _, row_values = self._find_row_by_id(worksheet, row_id)
+        if row_values is None:
+            return None
+
+        headers, _ = self._get_headers(worksheet)
+        return dict(zip_longest(headers, row_values[:len(headers)], fillvalue=''))
+
+
+    def _find_first_row_with_status(self, worksheet: Worksheet, status: str) -> Union[Dict, None]:
+        """
+        Scans a worksheet snapshot for the first row with the given status.
+        """
+
+        rows = self._snapshot(worksheet)
+        if not rows:
+            return None
+
+        headers = rows[0]
+        status_index = headers.index('Status')
+
+        for row in rows[1:]:
+            if len(row) > status_index and row[status_index] == status:
+                return dict(zip(headers, row))
+        return None
+
+
+    def _hand_out(self, worksheet: Worksheet, row_id: str) -> bool:
+        """
+        Reserves a row for a claim attempt by this process.
+
+        Returns False if the row was already handed out to another local claim within
+        the last `snapshot_ttl_seconds`, so that workers sharing this client try
+        different rows instead of racing for the same one.
+        """
+
+        key = (worksheet.id, str(row_id))
+        now = time.monotonic()
+
+        with self._handed_out_lock:
+            self._handed_out = {
+                handed_key: handed_at for handed_key, handed_at in self._handed_out.items()
+                if now - handed_at < self.config.snapshot_ttl_seconds
+            }
+
+            if key in self._handed_out:
+                return False
+
+            self._handed_out[key] = now
+            return True
+
+
+    def _iter_records_where(
+            self,
+            worksheet: Worksheet,
+            column: str,
+            value: str,
+            refresh: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Yields, as header -> value dictionaries, the snapshot rows whose `column` equals `value`.
+
+        Rows are matched on the raw snapshot by column position; a dictionary is only
+        built for the rows that match.
+        """
+
+        rows = self._snapshot(worksheet, refresh=refresh)
+        if not rows or column not in rows[0]:
+            return
+
+        headers = rows[0]
+        column_index = headers.index(column)
+
+        for row in rows[1:]:
+            if len(row) > column_index and row[column_index] == value:
+                yield dict(zip(headers, row))
+
+
+    def get_video_task_ids(self) -> Set[str]:
+        """
+        Retrieves the IDs of all video tasks by reading only the ID column.
+        """
+        return set(self._refresh_id_index(self.video_tasks_worksheet))
+
+
+    def find_next_pending_source(self) -> Union[Dict, None]:
+        """
+        Finds the first row in the sources worksheet with a 'pending' status.
+        """
+
+        try:
+            return self._find_first_row_with_status(self.sources_worksheet, self.config.STATUS_PENDING)
 
         except Exception as e:
             logger.error(f"Error finding next pending source: {e}")
@@ -161,24 +497,8 @@ class SheetClient:
         Finds the first row in the video tasks worksheet with a 'pending' status.
         """
 
-        self._wait_for_api()
-
         try:
-            status_col_index = self.video_tasks_worksheet.row_values(1).index('Status') + 1
-
-            self._wait_for_api()
-            pending_cells = self.video_tasks_worksheet.findall(self.config.STATUS_PENDING, in_column=status_col_index)
-
-            if not pending_cells:
-                return None
-
-            first_pending_cell = pending_cells[0]
-            
-            self._wait_for_api()
-            row_values = self.video_tasks_worksheet.row_values(first_pending_cell.row)
-            headers = self.video_tasks_worksheet.row_values(1)
-            
-            return dict(zip(headers, row_values))
+            return self._find_first_row_with_status(self.video_tasks_worksheet, self.config.STATUS_PENDING)
 
         except Exception as e:
             logger.error(f"Error finding next pending task: {e}")
@@ -189,51 +509,193 @@ class SheetClient:
         """
         Updates a row in a given worksheet based on its 'ID' and a dictionary of updates.
         """
-        self._wait_for_api()
-        all_records = worksheet.get_all_records()
-        row_index = -1 
-
-        for index, record in enumerate(all_records):
-            if str(record.get('ID')) == str(row_id):
-                row_index = index + 2
-                break
+        row_index, _ = self._find_row_by_id(worksheet, row_id)
 
         if row_index == -1:
             logger.warning(f"Row with ID {row_id} not found.")
             return
-        
-        update_list = []
-        
-        self._wait_for_api()
-        headers = worksheet.row_values(1)
-        header_map = {header: i + 1 for i, header in enumerate(headers)}
 
-        for key, value in updates.items():
-            column_index = header_map.get(key)
-            if column_index:
-                cell_to_update = gspread.Cell(row_index, column_index, value)
-                update_list.append(cell_to_update)
+        self.update_rows(worksheet, [(row_index, updates)])
 
-        if update_list:
-            self._wait_for_api()
-            worksheet.update_cells(update_list)
+
+    def update_rows(self, worksheet: Worksheet, row_updates: List[Tuple[int, Dict[str, str]]]):
+        """
+        Applies updates to several rows, given by row number, in a single API call.
+
+        Contiguous columns of a row are written as one range; a single range is sent
+        with `worksheet.update`, anything else with one `batch_update`.
+        """
+
+        _, header_map = self._get_headers(worksheet)
+        ranges = []
+
+        for row_index, updates in row_updates:
+            column_values = {
+                header_map[key]: value for key, value in updates.items() if key in header_map
+            }
+
+            if not column_values:
+                continue
+
+            columns = sorted(column_values)
+
+            if columns[-1] - columns[0] + 1 == len(columns):
+                ranges.append({
+                    'range': f"{rowcol_to_a1(row_index, columns[0])}:{rowcol_to_a1(row_index, columns[-1])}",
+                    'values': [[column_values[col] for col in columns]]
+                })
+            else:
+                ranges.extend(
+                    {'range': rowcol_to_a1(row_index, col), 'values': [[column_values[col]]]}
+                    for col in columns
+                )
+
+        if not ranges:
+            return
+
+        if len(ranges) == 1:
+            self._call(worksheet.update, ranges[0]['values'], ranges[0]['range'])
+        else:
+            self._call(worksheet.batch_update, ranges)
+
+        self._invalidate_snapshot(worksheet)
+
+
+    def enqueue_row_update(self, worksheet: Worksheet, row_id: str, updates: Dict[str, str]):
+        """
+        Queues an update for a row, identified by its 'ID', to be written together
+        with other queued updates.
+
+        Updates are flushed every `status_flush_interval_seconds`, or as soon as
+        `status_flush_max_batch` rows are queued, in a single `batch_update`. Later
+        updates to a queued row are merged into it. With an interval of 0, the
+        update is written immediately.
+        """
+
+        if self.config.status_flush_interval_seconds <= 0:
+            self.update_row(worksheet, row_id, updates)
+            return
+
+        key = (worksheet.id, str(row_id))
+
+        with self._pending_row_updates_lock:
+            _, queued = self._pending_row_updates.get(key, (worksheet, {}))
+            self._pending_row_updates[key] = (worksheet, {**queued, **updates})
+            pending_count = len(self._pending_row_updates)
+
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+                self._flusher.start()
+                atexit.register(self.flush_row_updates)
+
+        if pending_count >= self.config.status_flush_max_batch:
+            self._flush_event.set()
+
+
+    def _flush_loop(self):
+        """
+        Periodically writes the queued row updates. Runs in a daemon thread.
+        """
+
+        while True:
+            self._flush_event.wait(self.config.status_flush_interval_seconds)
+            self._flush_event.clear()
+
+            try:
+                self.flush_row_updates()
+            except Exception as e:
+                logger.error(f"Failed to flush queued row updates: {e}")
+
+
+    def flush_row_updates(self):
+        """
+        Writes all queued row updates, with one ID column read and one write per worksheet.
+        Updates that fail to be written are queued again, under any newer updates.
+        """
+
+        with self._pending_row_updates_lock:
+            pending = self._pending_row_updates
+            self._pending_row_updates = {}
+
+        if not pending:
+            return
+
+        by_worksheet: Dict[int, Tuple[Worksheet, Dict[str, Dict[str, str]]]] = {}
+        for (worksheet_id, row_id), (worksheet, updates) in pending.items():
+            by_worksheet.setdefault(worksheet_id, (worksheet, {}))[1][row_id] = updates
+
+        for worksheet, updates_by_id in by_worksheet.values():
+            try:
+                index = self._refresh_id_index(worksheet)
+                row_updates = []
+
+                for row_id, updates in updates_by_id.items():
+                    row_index = index.get(row_id)
+                    if row_index is None:
+                        logger.warning(f"Row with ID {row_id} not found.")
+                    else:
+                        row_updates.append((row_index, updates))
+
+                self.update_rows(worksheet, row_updates)
+                logger.info(f"Flushed {len(row_updates)} queued row updates to the '{worksheet.title}' worksheet.")
+
+            except Exception:
+                with self._pending_row_updates_lock:
+                    for row_id, updates in updates_by_id.items():
+                        key = (worksheet.id, row_id)
+                        _, newer = self._pending_row_updates.get(key, (worksheet, {}))
+                        self._pending_row_updates[key] = (worksheet, {**updates, **newer})
+                raise
+
+
+    def _max_rows_per_request(self, rows: List[List], max_rows: Union[int, None] = None) -> int:
+        """
+        Returns how many rows fit in one write without exceeding `max_cells_per_request`.
+        """
+
+        cells_per_row = max((len(row) for row in rows), default=1) or 1
+        batch_size = max(1, self.config.max_cells_per_request // cells_per_row)
+        return min(batch_size, max_rows) if max_rows else batch_size
 
 
     def append_rows(self, worksheet: Worksheet, data: List[List]):
         """
-        Appends a list of rows to a specified worksheet.
+        Appends a list of rows to a specified worksheet, split into chunks that stay
+        below `max_cells_per_request` cells each.
         """
         if not data:
             logger.warning("No data to append.")
             return
-        
-        try:
-            self._wait_for_api()
-            worksheet.append_rows(data, value_input_option='USER_ENTERED')
-            logger.info(f"Successfully appended {len(data)} rows to the '{worksheet.title}' worksheet.")
-        except APIError as e:
-            logger.error(f"API Error appending rows: {e}")
-            raise
+
+        batch_size = self._max_rows_per_request(data)
+
+        for start in range(0, len(data), batch_size):
+            chunk = data[start:start + batch_size]
+
+            try:
+                self._call(worksheet.append_rows, chunk, value_input_option='USER_ENTERED')
+                self._invalidate_snapshot(worksheet)
+                logger.info(
+                    f"Successfully appended rows {start + 1}-{start + len(chunk)} of {len(data)} "
+                    f"to the '{worksheet.title}' worksheet."
+                )
+            except APIError as e:
+                logger.error(f"API Error appending rows {start + 1}-{start + len(chunk)} of {len(data)}: {e}")
+                raise
+
+
+    def _build_source_row(self, parts: List[str]) -> List[str]:
+        """
+        Builds a Sources row from a URL followed by any extra columns.
+        """
+
+        return [
+            '',  # ID (auto-generated by sheet)
+            parts[0],
+            self.config.STATUS_PENDING,
+            '',  # ClaimedBy
+            '',  # ClaimedAt
+        ] + list(parts[1:])
 
 
     def add_source(self, *args):
@@ -242,91 +704,140 @@ class SheetClient:
         
         The arguments are expected to be in the order they should appear in the sheet
         after the static columns (ID, URL, Status, ClaimedBy, ClaimedAt). The first
-        argument must be the URL.
+        argument must be the URL. This is a thin wrapper around `add_sources_bulk`.
         """
 
         if not args:
             logger.error("Failed to add source: No arguments provided.")
             raise ValueError("add_source requires at least one argument for the URL.")
 
-        url = args[0]
+        self.add_sources_bulk([list(args)])
 
-        try:
 
-            new_row = [
-                '',  # ID (auto-generated by sheet)
-                url, # First argument from the file
-                self.config.STATUS_PENDING,
-                '',  # ClaimedBy
-                '',  # ClaimedAt
-            ] + list(args[1:]) # Append all other arguments from the file
+    def add_sources_bulk(self, rows: List[List[str]]):
+        """
+        Adds multiple sources to the Sources worksheet in batched API calls.
 
-            self._wait_for_api()
-            self.sources_worksheet.append_row(new_row, value_input_option='USER_ENTERED')
-            logger.info(f"Successfully added new source with URL: {url}")
+        Each row follows the same layout as the arguments to `add_source`: the URL
+        first, followed by any extra columns. Rows are appended in chunks of
+        `source_import_batch_size`, waiting between chunks only.
+        """
 
-        except IndexError:
-            logger.error("Failed to add source: Data was incomplete.")
-            raise ValueError("add_source requires at least one argument for the URL.")
-        
-        except Exception as e:
-            logger.error(f"Failed to add new source with URL '{url}': {e}")
-            raise
+        if not rows:
+            logger.warning("No sources to add.")
+            return
+
+        new_rows = [self._build_source_row(parts) for parts in rows]
+
+        batch_size = self._max_rows_per_request(new_rows, self.config.source_import_batch_size)
+
+        for start in range(0, len(new_rows), batch_size):
+            batch = new_rows[start:start + batch_size]
+
+            try:
+                self._call(self.sources_worksheet.append_rows, batch, value_input_option='USER_ENTERED')
+                self._invalidate_snapshot(self.sources_worksheet)
+                logger.info(f"Successfully added a batch of {len(batch)} new sources.")
+
+            except Exception as e:
+                logger.error(f"Failed to add a batch of {len(batch)} sources: {e}")
+                raise
 
 
     def _get_task_by_id(self, task_id: str) -> Union[Dict, None]:
         """
         Retrieves a single task record by its unique ID.
         """
-        all_tasks = self.get_video_tasks()
-        for task in all_tasks:
-            if str(task.get('ID')) == str(task_id):
-                return task
-        return None
+        return self._get_record_by_id(self.video_tasks_worksheet, task_id)
 
 
     def _get_source_by_id(self, source_id: str) -> Union[Dict, None]:
         """
         Retrieves a single source record by its unique ID.
         """
-        all_sources = self.get_sources()
-        for source in all_sources:
-            if str(source.get('ID')) == str(source_id):
-                return source
-        return None
+        return self._get_record_by_id(self.sources_worksheet, source_id)
 
 
-    def move_task_to_dead_letter(self, row_id: str, error_message: str = ""):
+    @staticmethod
+    def _to_extended_value(value, column: str) -> Dict:
         """
-        Moves a row from the video tasks worksheet to the dead-letter worksheet.
+        Converts a cell value to a Sheets API ExtendedValue. Only the numeric columns
+        ('Duration', 'RetryCount') are written as numbers; everything else is kept as
+        text, so IDs and URLs that happen to parse as numbers are not altered.
+        """
+
+        text = '' if value is None else str(value)
+        if column not in _NUMERIC_COLUMNS:
+            return {'stringValue': text}
+
+        try:
+            number = float(text)
+        except ValueError:
+            return {'stringValue': text}
+
+        return {'numberValue': number} if math.isfinite(number) else {'stringValue': text}
+
+
+    def _move_row_to_dead_letter(
+        self, worksheet: Worksheet, dead_letter_worksheet: Worksheet, row_id: str, error_message: str
+    ) -> bool:
         """
-        self._wait_for_api()
-        all_records = self.video_tasks_worksheet.get_all_records()
-        row_index = -1
-        row_to_move = None
+        Moves a row to a dead-letter worksheet with its 'LastError' set.
 
-        for index, record in enumerate(all_records):
-            if str(record.get('ID')) == str(row_id):
-                row_index = index + 2
-                self._wait_for_api()
-                row_to_move = self.video_tasks_worksheet.row_values(row_index)
-                break
+        The append to the dead-letter worksheet and the delete from the original
+        worksheet are sent as one atomic spreadsheet batch update, so the row is never
+        missing from (or present in) both worksheets. Returns False if the row was not found.
+        """
 
+        row_index, row_to_move = self._find_row_by_id(worksheet, row_id)
         if not row_to_move:
-            logger.warning(f"Row with ID {row_id} not found.")
-            return
+            return False
+
+        dead_letter_headers, dead_letter_header_map = self._get_headers(dead_letter_worksheet)
+        error_column = dead_letter_header_map.get('LastError')
+
+        if error_column:
+            row_to_move = list(row_to_move) + [''] * (error_column - len(row_to_move))
+            row_to_move[error_column - 1] = error_message
+
+        body = {'requests': [
+            {'appendCells': {
+                'sheetId': dead_letter_worksheet.id,
+                'rows': [{'values': [
+                    {'userEnteredValue': self._to_extended_value(value, column)}
+                    for value, column in zip_longest(row_to_move, dead_letter_headers[:len(row_to_move)])
+                ]}],
+                'fields': 'userEnteredValue'
+            }},
+            {'deleteDimension': {
+                'range': {
+                    'sheetId': worksheet.id,
+                    'dimension': 'ROWS',
+                    'startIndex': row_index - 1,
+                    'endIndex': row_index
+                }
+            }}
+        ]}
+
+        self._call(self.spreadsheet.batch_update, body)
+        self._invalidate_snapshot(worksheet)
+        self._invalidate_snapshot(dead_letter_worksheet)
+        self._remove_from_id_index(worksheet, row_index)
+        return True
 
+
+    def move_task_to_dead_letter(self, row_id: str, error_message: str = ""):
+        """
+        Moves a row from the video tasks worksheet to the dead-letter worksheet.
+        """
         try:
-            self._wait_for_api()
-            self.task_dead_letter_worksheet.append_row(row_to_move, value_input_option='USER_ENTERED')
-            self.update_row(
-                worksheet=self.task_dead_letter_worksheet,
-                row_id=row_id,
-                updates={'LastError': error_message}
+            moved = self._move_row_to_dead_letter(
+                self.video_tasks_worksheet, self.task_dead_letter_worksheet, row_id, error_message
             )
+            if not moved:
+                logger.warning(f"Row with ID {row_id} not found.")
+                return
 
-            self._wait_for_api()
-            self.video_tasks_worksheet.delete_rows(row_index)
             logger.info(f"Successfully moved row with ID {row_id} to the dead-letter queue.")
         except APIError as e:
             logger.error(f"API Error moving row to dead-letter queue: {e}")
@@ -336,33 +847,14 @@ class SheetClient:
         """
         Moves a row from the sources worksheet to the source dead-letter worksheet.
         """
-        self._wait_for_api()
-        all_records = self.sources_worksheet.get_all_records()
-        row_index = -1
-        row_to_move = None
-
-        for index, record in enumerate(all_records):
-            if str(record.get('ID')) == str(row_id):
-                row_index = index + 2
-                self._wait_for_api()
-                row_to_move = self.sources_worksheet.row_values(row_index)
-                break
-
-        if not row_to_move:
-            logger.warning(f"Source row with ID {row_id} not found.")
-            return
-
         try:
-            self._wait_for_api()
-            self.source_dead_letter_worksheet.append_row(row_to_move, value_input_option='USER_ENTERED')
-            self.update_row(
-                worksheet=self.source_dead_letter_worksheet,
-                row_id=row_id,
-                updates={'LastError': error_message}
+            moved = self._move_row_to_dead_letter(
+                self.sources_worksheet, self.source_dead_letter_worksheet, row_id, error_message
             )
+            if not moved:
+                logger.warning(f"Source row with ID {row_id} not found.")
+                return
 
-            self._wait_for_api()
-            self.sources_worksheet.delete_rows(row_index)
             logger.info(f"Successfully moved source row with ID {row_id} to the source dead-letter queue.")
         except APIError as e:
             logger.error(f"API Error moving source row to dead-letter queue: {e}")
@@ -374,5 +866,37 @@ class SheetClient:
         Retrieves all video tasks for a given source ID.
         """
         
-        all_tasks = self.get_video_tasks()
-        return [task for task in all_tasks if str(task.get('SourceID')) == str(source_id)]
\ No newline at end of file
+        return list(self._iter_records_where(self.video_tasks_worksheet, 'SourceID', str(source_id)))
+
+
+    def get_done_tasks_for(self, source_id: str, hostname: str) -> List[str]:
+        """
+        Retrieves the IDs of video tasks from a source that were completed by a given host.
+
+        Only the ID, SourceID, Status and ClaimedBy columns are read, in a single
+        batched request.
+        """
+
+        _, header_map = self._get_headers(self.video_tasks_worksheet)
+        columns = ['ID', 'SourceID', 'Status', 'ClaimedBy']
+
+        ranges = []
+        for column in columns:
+            col_letter = rowcol_to_a1(1, header_map[column])[:-1]
+            ranges.append(f"{col_letter}2:{col_letter}")
+
+        id_values, source_values, status_values, claimed_values = (
+            [row[0] if row else '' for row in value_range]
+            for value_range in self._call(self.video_tasks_worksheet.batch_get, ranges)
+        )
+
+        return [
+            str(task_id)
+            for task_id, task_source, status, claimed_by in zip_longest(
+                id_values, source_values, status_values, claimed_values, fillvalue=''
+            )
+            if task_id
+            and str(task_source) == str(source_id)
+            and status == self.config.STATUS_DONE
+            and claimed_by == hostname
+        ]
\ No newline at end of file
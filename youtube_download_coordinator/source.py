@@ -1,8 +1,30 @@
+import sys
 from dataclasses import dataclass
-from typing import Optional, Dict
+from typing import Any, Callable, Optional, Dict
 
 
-@dataclass
+def _maybe(cast: Callable[[Any], Any], value: Any, default: Any = None) -> Any:
+    """
+    Casts a cell value, returning the default for missing or empty cells.
+    """
+    return cast(value) if value not in (None, '') else default
+
+
+# (attribute, sheet column) pairs copied verbatim from a row.
+_TEXT_COLUMNS = (
+    ('claimed_by', 'ClaimedBy'),
+    ('claimed_at', 'ClaimedAt'),
+    ('name', 'Name'),
+    ('gender', 'Gender'),
+    ('accent', 'Accent'),
+    ('content_type', 'ContentType'),
+    ('source_type', 'Type'),
+    ('last_error', 'LastError'),
+)
+
+
+# slots=True is only accepted from Python 3.10 on.
+@dataclass(frozen=True, **({'slots': True} if sys.version_info >= (3, 10) else {}))
 class Source:
     """
     A data class to represent a single source for video tasks.
@@ -39,14 +61,7 @@ class Source:
             id=data.get('ID', ''),
             url=data.get('URL', ''),
             status=data.get('Status', 'pending'),
-            claimed_by=data.get('ClaimedBy'),
-            claimed_at=data.get('ClaimedAt'),
-            name=data.get('Name'),
-            gender=data.get('Gender'),
-            accent=data.get('Accent'),
-            content_type=data.get('ContentType'),
-            source_type=data.get('Type'),
-            multispeaker_percentage=float(data['MultispeakerPercentage']) if 'MultispeakerPercentage' in data and data['MultispeakerPercentage'] not in (None, '') else None,
-            retry_count=int(data.get('RetryCount', 0)) if 'RetryCount' in data and data['RetryCount'] not in (None, '') else 0,
-            last_error=data.get('LastError')
-        )
\ No newline at end of file
+            multispeaker_percentage=_maybe(float, data.get('MultispeakerPercentage')),
+            retry_count=_maybe(int, data.get('RetryCount'), 0),
+            **{attribute: data.get(column) for attribute, column in _TEXT_COLUMNS}
+        )
@@ -1,7 +1,11 @@
 import logging
+import operator
+import queue
 import random
+import threading
 import time
-from typing import Dict, List, Union, Iterator, Set
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Tuple, Union, Iterator, Set
 
 import yt_dlp
 from yt_dlp.utils import DownloadError
@@ -9,12 +13,18 @@ from yt_dlp.utils import DownloadError
 from .sheet_client import SheetClient
 from .source import Source
 from .video_task import VideoTask
-from .utils.time_utils import get_current_timestamp
+from .utils.time_utils import get_current_timestamp, parse_timestamp
 from .utils.system_utils import get_machine_hostname
 
 
 logger = logging.getLogger(__name__)
 
+# Reads a VideoTask's fields in the column order of the Video Tasks sheet.
+_VIDEO_TASK_ROW = operator.attrgetter(
+    'id', 'source_id', 'url', 'status', 'duration',
+    'claimed_by', 'claimed_at', 'retry_count', 'last_error'
+)
+
 
 class SourceManager:
     """
@@ -28,80 +38,314 @@ class SourceManager:
         """
 
         self.client = sheet_client
+        self._ydl: Union[yt_dlp.YoutubeDL, None] = None
+        self._ydl_lock = threading.Lock()
+        self._thread_local = threading.local()
+        self._lost_last_claim = False
 
 
     def get_next_source_to_expand(self) -> Union[Source, None]:
         """
         Claims the next pending source from the spreadsheet for expansion.
+
+        A single fresh snapshot of the Sources sheet is used to find both a stalled
+        source and the first pending one. The stall reset and the claim are written
+        together in one request, then the claim is verified.
+
+        Sheets has no conditional write, so contention is only detected by the
+        verification. The random claim jitter is therefore applied only after a
+        claim was lost to another machine, instead of before every attempt.
         """
 
-        time.sleep(random.uniform(0, self.client.config.claim_jitter_seconds))
+        # Cleared first, so that an exception during the attempt does not leave it set.
+        lost_last_claim, self._lost_last_claim = self._lost_last_claim, False
+        if lost_last_claim:
+            time.sleep(random.uniform(0, self.client.config.claim_jitter_seconds))
 
-        stalled_source_data = self._find_stalled_source()
-        if stalled_source_data:
-            self._reset_stalled_source(stalled_source_data)
+        source, self._lost_last_claim = self._attempt_source_claim()
+        return source
+
+
+    def _attempt_source_claim(self) -> Tuple[Union[Source, None], bool]:
+        """
+        Performs one claim attempt.
+
+        Returns:
+            Tuple[Union[Source, None], bool]: The claimed source, if any, and whether the
+            claim was lost to another machine.
+        """
+
+        config = self.client.config
+        worksheet = self.client.sources_worksheet
+
+        rows = self.client._snapshot(worksheet, refresh=True)
+        if len(rows) < 2:
+            return None, False
+
+        headers = rows[0]
+        status_index = headers.index('Status')
+        id_index = headers.index('ID')
+        cutoff_epoch = time.time() - config.stalled_task_timeout_minutes * 60
+
+        # Bound locally: the loop below can run over thousands of rows.
+        status_in_progress = config.STATUS_IN_PROGRESS
+        status_pending = config.STATUS_PENDING
+        is_stalled = self._is_stalled
+        hand_out = self.client._hand_out
+
+        stalled = None
+        pending = None
+
+        for row_index, row in enumerate(rows[1:], 2):
+            status = row[status_index] if len(row) > status_index else ''
+
+            if status == status_in_progress:
+                if stalled is None:
+                    record = dict(zip(headers, row))
+                    if is_stalled(record, cutoff_epoch):
+                        stalled = (row_index, record)
+
+            elif status == status_pending and pending is None and hand_out(worksheet, row[id_index]):
+                pending = (row_index, dict(zip(headers, row)))
+
+            if stalled and pending:
+                break
 
-        source_data = self.client.find_next_pending_source()
-        if not source_data:
-            return None
-        
-        source_id = str(source_data.get('ID'))
         hostname = get_machine_hostname()
         timestamp = get_current_timestamp()
+        claim_updates = {
+            'Status': config.STATUS_IN_PROGRESS,
+            'ClaimedBy': hostname,
+            'ClaimedAt': timestamp
+        }
+
+        row_updates = []
+        dead_letter_id = None
+
+        if stalled:
+            stalled_row, stalled_record = stalled
+            new_retry_count = int(stalled_record.get('RetryCount') or 0) + 1
+
+            if new_retry_count > config.max_retries:
+                dead_letter_id = str(stalled_record.get('ID'))
+
+            elif pending is None:
+                # Nothing else is pending: reclaim the stalled source directly.
+                pending = stalled
+                claim_updates['RetryCount'] = new_retry_count
+                logger.info(f"Reclaiming stalled source with ID {stalled_record.get('ID')}.")
+
+            else:
+                row_updates.append((stalled_row, {
+                    'Status': config.STATUS_PENDING,
+                    'ClaimedBy': '',
+                    'ClaimedAt': '',
+                    'RetryCount': new_retry_count
+                }))
+                logger.info(f"Reset stalled source with ID {stalled_record.get('ID')} to 'pending'.")
+
+        if pending:
+            row_updates.append((pending[0], claim_updates))
+
+        source_id = str(pending[1].get('ID')) if pending else None
 
         try:
-            self.client.update_row(
-                worksheet=self.client.sources_worksheet,
-                row_id=source_id,
-                updates={
-                    'Status': self.client.config.STATUS_IN_PROGRESS,
-                    'ClaimedBy': hostname,
-                    'ClaimedAt': timestamp
-                }
-            )
+            if row_updates:
+                self.client.update_rows(worksheet, row_updates)
+
+            if dead_letter_id:
+                self.client.move_source_to_dead_letter(
+                    row_id=dead_letter_id,
+                    error_message="Source stalled after maximum retries."
+                )
+
+            if not source_id:
+                return None, False
+
+            # The values echoed back by the write only reflect this client's own write,
+            # so they cannot detect a competing claim; re-read the row (a single-row
+            # lookup through the ID index) instead.
             re_read_source = self.client._get_source_by_id(source_id)
 
-            if re_read_source and re_read_source.get('ClaimedBy') == hostname:
+            lost_claim = not (re_read_source and re_read_source.get('ClaimedBy') == hostname)
+
+            if not lost_claim:
                 logger.info(f"Successfully claimed source ID {source_id}.")
-                return Source.from_dict(re_read_source)
+                return Source.from_dict(re_read_source), False
             else:
                 logger.warning(f"Failed to claim source ID {source_id}. Another machine claimed it first.")
-                return None
+                return None, True
         
         except Exception as e:
             logger.error(f"Failed to claim source ID {source_id}: {e}")
-            return None
+            return None, False
         
 
-    def _extract_videos_from_source(self, source: Source) -> Iterator[VideoTask]:
+    def _iter_video_entries(self, ydl: yt_dlp.YoutubeDL, info_dict: Dict) -> Iterator[Dict]:
+        """
+        Yields the video entries of a flat-extracted info dict, resolving nested
+        playlists (e.g. the tabs of a channel) on the way.
+        """
+
+        if 'entries' not in info_dict:
+            yield info_dict
+            return
+
+        for entry in info_dict['entries']:
+            if not entry:
+                yield entry
+                continue
+
+            is_nested_playlist = entry.get('_type') == 'playlist' or (
+                entry.get('_type') in ('url', 'url_transparent')
+                and entry.get('ie_key') not in (None, 'Youtube')
+            )
+
+            if is_nested_playlist:
+                nested_info = ydl.extract_info(entry['url'], download=False) if entry.get('url') else entry
+                if nested_info:
+                    yield from self._iter_video_entries(ydl, nested_info)
+            else:
+                yield entry
+
+
+    @staticmethod
+    def _get_entry_url(entry: Dict) -> Union[str, None]:
+        """
+        Returns the watch URL of a video entry. Flat entries carry no 'webpage_url',
+        so it is derived from 'url' or the video ID.
+        """
+
+        if entry.get('webpage_url'):
+            return entry['webpage_url']
+
+        url = entry.get('url')
+        if url and url.startswith('http'):
+            return url
+
+        if entry.get('id'):
+            return f"https://www.youtube.com/watch?v={entry['id']}"
+        return None
+
+
+    def _fetch_entry_metadata(self, entry: Dict) -> Union[Dict, None]:
+        """
+        Resolves the full metadata of a flat video entry with the calling thread's own
+        YoutubeDL instance, created on the thread's first fetch.
+        Entries that are already fully extracted are returned unchanged.
+        """
+
+        if not entry or entry.get('_type') not in ('url', 'url_transparent'):
+            return entry
+
+        entry_url = self._get_entry_url(entry)
+        if not entry_url:
+            return entry
+
+        ydl = getattr(self._thread_local, 'ydl', None)
+        if ydl is None:
+            ydl_opts = {'quiet': True, 'skip_download': True, 'ignoreerrors': True}
+            ydl = self._thread_local.ydl = yt_dlp.YoutubeDL(ydl_opts)
+
+        return ydl.extract_info(entry_url, download=False)
+
+
+    def _fetch_full_entries(self, entries: Iterable[Dict], known_ids: Set[str]) -> Iterator[Union[Dict, None]]:
+        """
+        Resolves the full metadata of flat entries in parallel, bounded by `expand_workers`.
+        Entries are yielded as soon as they are resolved, not in playlist order.
+
+        At most twice `expand_workers` fetches are in flight at a time, so entries are
+        streamed while the playlist is still being listed. If the consumer stops early,
+        the fetches that have not started are cancelled.
+
+        Entries whose ID is in `known_ids` are passed through unresolved, since they
+        will be discarded as duplicates anyway.
+        """
+
+        workers = self.client.config.expand_workers
+        max_in_flight = 2 * workers
+        executor = ThreadPoolExecutor(max_workers=workers)
+        in_flight = set()
+
+        try:
+            for entry in entries:
+                if entry and str(entry.get('id')) in known_ids:
+                    yield entry
+                    continue
+
+                in_flight.add(executor.submit(self._fetch_entry_metadata, entry))
+
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+
+    def _get_ydl(self) -> yt_dlp.YoutubeDL:
+        """
+        Returns the shared flat-extraction YoutubeDL instance, creating it on first use.
+        """
+
+        if self._ydl is None:
+            ydl_opts = {'quiet': True, 'extract_flat': 'in_playlist', 'skip_download': True, 'ignoreerrors': True}
+            self._ydl = yt_dlp.YoutubeDL(ydl_opts)
+        return self._ydl
+
+
+    def _extract_videos_from_source(
+            self,
+            source: Source,
+            known_ids: Union[Set[str], None] = None
+    ) -> Iterator[VideoTask]:
         """
         Uses yt-dlp to extract all video data from a source URL and yields
         validated VideoTask objects. This is a generator for memory efficiency.
-        """
 
-        ydl_opts = {'quiet': True, 'extract_flat': False, 'force_generic_extractor': False, 'ignoreerrors': True}
+        Playlists are extracted flat, so only the playlist pages are fetched instead
+        of the full metadata of every video. Durations missing from flat entries are
+        left empty, unless `expand_full_metadata` is set, in which case every entry
+        not in `known_ids` is resolved in parallel.
+        """
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with self._ydl_lock:
+                ydl = self._get_ydl()
                 info_dict = ydl.extract_info(source.url, download=False)
                 
                 if not info_dict:
                     logger.warning(f"No information extracted from source {source.id}. It may be empty or private.")
                     return
 
-                entries = info_dict.get('entries', [info_dict])
-                
+                entries = self._iter_video_entries(ydl, info_dict)
+                if self.client.config.expand_full_metadata:
+                    entries = self._fetch_full_entries(entries, known_ids or set())
+
                 for entry in entries:
-                    if not (entry and entry.get('id') and entry.get('webpage_url')):
+                    entry_url = self._get_entry_url(entry) if entry else None
+
+                    if not (entry and entry.get('id') and entry_url):
                         logger.warning(f"Skipping invalid video entry from source {source.id}")
                         continue
 
+                    duration = entry.get('duration')
+
                     yield VideoTask(
                         id=str(entry['id']),
                         source_id=str(source.id),
-                        url=entry['webpage_url'],
+                        url=entry_url,
                         status=self.client.config.STATUS_PENDING,
-                        duration=entry.get('duration'),
+                        duration=int(duration) if duration is not None else None,
                     )
         except DownloadError as e:
             logger.error(f"yt-dlp error expanding source {source.url}: {e}")
@@ -115,39 +359,56 @@ class SourceManager:
 
         try:
             logger.info("Fetching existing video tasks to prevent duplicates...")
-            existing_tasks = self.client.get_video_tasks()
-            existing_video_ids: Set[str] = {str(task.get('ID')) for task in existing_tasks}
+            existing_video_ids: Set[str] = self.client.get_video_task_ids()
             logger.info(f"Found {len(existing_video_ids)} existing video tasks.")
 
             logger.info(f"Starting video extraction from source {source.id}. This may take a moment...")
-            
-            all_tasks_from_source = list(self._extract_videos_from_source(source))
-            
-            logger.info(f"Extraction complete. Found {len(all_tasks_from_source)} total videos. Now filtering and batching.")
 
-            batch = []
+            new_rows = []
+            total_found = 0
             total_added = 0
             total_skipped = 0
             batch_size = self.client.config.video_task_batch_size
 
-            for task in all_tasks_from_source:
-                if task.id not in existing_video_ids:
-                    batch.append(task)
+            # Batches are written by a background thread while extraction continues.
+            write_queue: "queue.Queue[Union[List[List], None]]" = queue.Queue(maxsize=4)
+            write_errors: List[Exception] = []
+            writer = threading.Thread(
+                target=self._task_writer_loop, args=(write_queue, write_errors), daemon=True
+            )
+            writer.start()
+
+            try:
+                for task in self._extract_videos_from_source(source, existing_video_ids):
+                    total_found += 1
+
+                    if task.id in existing_video_ids:
+                        total_skipped += 1
+                        continue
+
                     existing_video_ids.add(task.id)
-                    
-                    if len(batch) >= batch_size:
-                        self._add_video_tasks_batch_to_sheet(batch)
-                        total_added += len(batch)
-                        batch = []
-                else:
-                    total_skipped += 1
-            
-            if batch:
-                self._add_video_tasks_batch_to_sheet(batch)
-                total_added += len(batch)
+                    new_rows.append(list(_VIDEO_TASK_ROW(task)))
+
+                    if len(new_rows) >= batch_size:
+                        if write_errors:
+                            break
+                        write_queue.put(new_rows)
+                        total_added += len(new_rows)
+                        new_rows = []
+
+                if new_rows and not write_errors:
+                    write_queue.put(new_rows)
+                    total_added += len(new_rows)
+
+            finally:
+                write_queue.put(None)
+                writer.join()
+
+            if write_errors:
+                raise write_errors[0]
             
             logger.info(
-                f"Source expansion summary for source ID {source.id}: "
+                f"Source expansion summary for source ID {source.id}: {total_found} videos found, "
                 f"{total_added} new tasks added, {total_skipped} duplicates skipped."
             )
             self.mark_source_as_done(str(source.id))
@@ -166,19 +427,32 @@ class SourceManager:
             return False
 
 
-    def _add_video_tasks_batch_to_sheet(self, tasks_batch: List[VideoTask]):
+    def _task_writer_loop(self, write_queue: "queue.Queue[Union[List[List], None]]", write_errors: List[Exception]):
+        """
+        Appends the row batches put on the queue until it receives None.
+        After the first failure, the remaining batches are drained without writing.
+        """
+
+        while True:
+            new_rows = write_queue.get()
+            if new_rows is None:
+                return
+
+            if write_errors:
+                continue
+
+            try:
+                self._add_video_task_rows_to_sheet(new_rows)
+            except Exception as e:
+                write_errors.append(e)
+
+
+    def _add_video_task_rows_to_sheet(self, new_rows: List[List]):
         """
-        Converts a batch of VideoTask objects to a list of lists and appends them to the sheet.
+        Appends a batch of video task rows to the sheet.
         """
-        if not tasks_batch:
+        if not new_rows:
             return
-        
-        new_rows = [
-            [
-                task.id, task.source_id, task.url, task.status, task.duration,
-                task.claimed_by, task.claimed_at, task.retry_count, task.last_error
-            ] for task in tasks_batch
-        ]
 
         try:
             self.client.append_rows(self.client.video_tasks_worksheet, new_rows)
@@ -188,53 +462,25 @@ class SourceManager:
             raise
 
 
-    def _find_stalled_source(self) -> Union[Dict, None]:
+    def _is_stalled(self, record: Dict, cutoff_epoch: float) -> bool:
         """
-        Scans the Sources sheet for any 'in-progress' sources that have timed out.
+        Checks whether an 'in-progress' source was claimed before the cutoff time.
         """
-        records = self.client.get_sources()
-        current_time_epoch = time.time()
-        timeout_seconds = self.client.config.stalled_task_timeout_minutes * 60
-
-        for record in records:
-            if record.get('Status') == self.client.config.STATUS_IN_PROGRESS:
-                claimed_at_str = record.get('ClaimedAt')
-                if claimed_at_str:
-                    try:
-                        claimed_at_epoch = time.mktime(time.strptime(claimed_at_str, "%Y-%m-%d %H:%M:%S"))
-                        if (current_time_epoch - claimed_at_epoch) > timeout_seconds:
-                            logger.warning(f"Found stalled source: ID {record.get('ID')}")
-                            return record
-                    except ValueError:
-                        logger.error(f"Could not parse ClaimedAt timestamp for source ID {record.get('ID')}")
-        return None
 
+        claimed_at_str = record.get('ClaimedAt')
+        if not claimed_at_str:
+            return False
 
-    def _reset_stalled_source(self, source_data: Dict):
-        """Resets a stalled source to 'pending' and increments its retry count."""
         try:
-            new_retry_count = int(source_data.get('RetryCount', 0)) + 1
-            if new_retry_count > self.client.config.max_retries:
-                self.client.move_source_to_dead_letter(
-                    row_id=str(source_data.get('ID')),
-                    error_message="Source stalled after maximum retries."
-                )
-                return
+            claimed_at_epoch = parse_timestamp(claimed_at_str)
+        except ValueError:
+            logger.error(f"Could not parse ClaimedAt timestamp for source ID {record.get('ID')}")
+            return False
 
-            self.client.update_row(
-                worksheet=self.client.sources_worksheet,
-                row_id=str(source_data.get('ID')),
-                updates={
-                    'Status': self.client.config.STATUS_PENDING,
-                    'ClaimedBy': '',
-                    'ClaimedAt': '',
-                    'RetryCount': new_retry_count
-                }
-            )
-            logger.info(f"Reset stalled source with ID {source_data.get('ID')} to 'pending'.")
-            time.sleep(self.client.config.api_wait_seconds)
-        except Exception as e:
-            logger.error(f"Failed to reset stalled source ID {source_data.get('ID')}: {e}")
+        if claimed_at_epoch < cutoff_epoch:
+            logger.warning(f"Found stalled source: ID {record.get('ID')}")
+            return True
+        return False
 
 
     def mark_source_as_done(self, source_id: str):
@@ -252,7 +498,7 @@ class SourceManager:
 
     def mark_source_as_error(self, source: Source, error_message: str = ""):
         """Updates the status of a source to 'error' if expansion fails."""
-        is_fatal = any(sub in error_message for sub in self.client.config.fatal_error_substrings)
+        is_fatal = self.client.config.is_fatal_error(error_message)
 
         if source.retry_count >= self.client.config.max_retries or is_fatal:
             try:
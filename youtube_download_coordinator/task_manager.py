@@ -1,11 +1,11 @@
 import logging
 import random
 import time
-from typing import Dict, Union
+from typing import Dict, Tuple, Union
 
 from .sheet_client import SheetClient
 from .video_task import VideoTask
-from .utils.time_utils import get_current_timestamp
+from .utils.time_utils import get_current_timestamp, parse_timestamp
 from .utils.system_utils import get_machine_hostname
 
 
@@ -26,6 +26,7 @@ class TaskManager:
         """
         
         self.client = sheet_client
+        self._lost_last_claim = False
 
 
     def get_next_task(self) -> Union[VideoTask, None]:
@@ -34,83 +35,166 @@ class TaskManager:
 
         This method implements a claim-and-verify pattern to ensure only one
         machine can work on a task at a time. It also handles stalled tasks.
+        The random claim jitter is only applied after a claim was lost to
+        another machine, so uncontended claims are not delayed.
+
+        A single fresh snapshot of the Video Tasks sheet is used to find both a
+        stalled task and the first pending one, and the stall reset and the claim
+        are written together in one request.
         """
 
-        time.sleep(random.uniform(0, self.client.config.claim_jitter_seconds))
+        task, _ = self.claim_next_task()
+        return task
 
-        stalled_task_data = self._find_stalled_task()
-        
-        if stalled_task_data:
-            new_retry_count = int(stalled_task_data.get('RetryCount', 0)) + 1
-            if new_retry_count > self.client.config.max_retries:
-                self.client.move_task_to_dead_letter(
-                    row_id=str(stalled_task_data.get('ID')),
-                    error_message="Task stalled after maximum retries."
-                )
-            else:
-                self.client.update_row(
-                    worksheet=self.client.video_tasks_worksheet,
-                    row_id=str(stalled_task_data.get('ID')),
-                    updates={
-                        'Status': self.client.config.STATUS_PENDING,
-                        'RetryCount': new_retry_count
-                    }
-                )
-                logger.info(f"Reset stalled task with ID {stalled_task_data.get('ID')} to 'pending'.")
-                time.sleep(self.client.config.api_wait_seconds)
 
-        task_data = self.client.find_next_pending_task()
-        if not task_data:
+    def claim_next_task(self) -> Tuple[Union[VideoTask, None], bool]:
+        """
+        Claims the next available video task, like `get_next_task`, and also
+        reports whether the claim was lost to another machine.
+
+        Returns:
+            Tuple[Union[VideoTask, None], bool]: The claimed task, if any, and whether the
+            claim was lost to another machine.
+        """
+
+        # Cleared first, so that an exception during the attempt does not leave it set.
+        lost_last_claim, self._lost_last_claim = self._lost_last_claim, False
+        if lost_last_claim:
+            time.sleep(random.uniform(0, self.client.config.claim_jitter_seconds))
+
+        task, self._lost_last_claim = self._attempt_task_claim()
+        return task, self._lost_last_claim
+
+
+    def _attempt_task_claim(self) -> Tuple[Union[VideoTask, None], bool]:
+        """
+        Performs one claim attempt.
+
+        Returns:
+            Tuple[Union[VideoTask, None], bool]: The claimed task, if any, and whether the
+            claim was lost to another machine.
+        """
+
+        config = self.client.config
+        worksheet = self.client.video_tasks_worksheet
+
+        rows = self.client._snapshot(worksheet, refresh=True)
+        if len(rows) < 2:
             logger.info("No pending video tasks found.")
-            return None
+            return None, False
+
+        headers = rows[0]
+        status_index = headers.index('Status')
+        id_index = headers.index('ID')
+        cutoff_epoch = time.time() - config.stalled_task_timeout_minutes * 60
+
+        # Bound locally: the loop below can run over thousands of rows.
+        status_in_progress = config.STATUS_IN_PROGRESS
+        status_pending = config.STATUS_PENDING
+        is_stalled = self._is_stalled
+        hand_out = self.client._hand_out
+
+        stalled = None
+        pending = None
+
+        for row_index, row in enumerate(rows[1:], 2):
+            status = row[status_index] if len(row) > status_index else ''
+
+            if status == status_in_progress:
+                if stalled is None:
+                    record = dict(zip(headers, row))
+                    if is_stalled(record, cutoff_epoch):
+                        stalled = (row_index, record)
+
+            elif status == status_pending and pending is None and hand_out(worksheet, row[id_index]):
+                pending = (row_index, dict(zip(headers, row)))
+
+            if stalled and pending:
+                break
 
-        task_id = str(task_data.get('ID'))
         hostname = get_machine_hostname()
         timestamp = get_current_timestamp()
+        claim_updates = {
+            'Status': config.STATUS_IN_PROGRESS,
+            'ClaimedBy': hostname,
+            'ClaimedAt': timestamp
+        }
+
+        row_updates = []
+        dead_letter_id = None
+
+        if stalled:
+            stalled_row, stalled_record = stalled
+            new_retry_count = int(stalled_record.get('RetryCount') or 0) + 1
+
+            if new_retry_count > config.max_retries:
+                dead_letter_id = str(stalled_record.get('ID'))
+
+            elif pending is None:
+                # Nothing else is pending: reclaim the stalled task directly.
+                pending = stalled
+                claim_updates['RetryCount'] = new_retry_count
+                logger.info(f"Reclaiming stalled task with ID {stalled_record.get('ID')}.")
+
+            else:
+                row_updates.append((stalled_row, {
+                    'Status': config.STATUS_PENDING,
+                    'RetryCount': new_retry_count
+                }))
+                logger.info(f"Reset stalled task with ID {stalled_record.get('ID')} to 'pending'.")
+
+        if pending:
+            row_updates.append((pending[0], claim_updates))
+
+        task_id = str(pending[1].get('ID')) if pending else None
 
         try:
-            self.client.update_row(
-                worksheet=self.client.video_tasks_worksheet,
-                row_id=str(task_id),
-                updates={
-                    'Status': self.client.config.STATUS_IN_PROGRESS,
-                    'ClaimedBy': hostname,
-                    'ClaimedAt': timestamp
-                }
-            )
+            if row_updates:
+                self.client.update_rows(worksheet, row_updates)
+
+            if dead_letter_id:
+                self.client.move_task_to_dead_letter(
+                    row_id=dead_letter_id,
+                    error_message="Task stalled after maximum retries."
+                )
+
+            if not task_id:
+                logger.info("No pending video tasks found.")
+                return None, False
+
+            re_read_task = self.client._get_task_by_id(task_id)
 
-            re_read_task = self.client._get_task_by_id(str(task_id))
+            lost_claim = not (re_read_task and re_read_task.get('ClaimedBy') == hostname)
 
-            if re_read_task and re_read_task.get('ClaimedBy') == hostname:
+            if not lost_claim:
                 logger.info(f"Successfully claimed task ID {task_id}.")
-                return VideoTask.from_dict(re_read_task)
+                return VideoTask.from_dict(re_read_task), False
             
             else:
                 logger.warning(f"Failed to claim task ID {task_id}. Another machine claimed it first.")
-                return None
+                return None, True
 
         except Exception as e:
             logger.error(f"Error while claiming task ID {task_id}: {e}")
-            return None
+            return None, False
     
 
-    def _find_stalled_task(self) -> Union[Dict, None]:
+    def _is_stalled(self, record: Dict, cutoff_epoch: float) -> bool:
         """
-        Scans the video tasks sheet for any 'in-progress' tasks that have timed out.
+        Checks whether an 'in-progress' task was claimed before the cutoff time.
         """
 
-        records = self.client.get_video_tasks()
-        current_time_epoch = time.time()
-        timeout_seconds = self.client.config.stalled_task_timeout_minutes * 60
-
-        for record in records:
-            if record.get('Status') == self.client.config.STATUS_IN_PROGRESS:
-                claimed_at_str = record.get('ClaimedAt')
-                if claimed_at_str:
-                    claimed_at_epoch = time.mktime(time.strptime(claimed_at_str, "%Y-%m-%d %H:%M:%S"))
-                    if (current_time_epoch - claimed_at_epoch) > timeout_seconds:
-                        return record
-        return None
+        claimed_at_str = record.get('ClaimedAt')
+        if not claimed_at_str:
+            return False
+
+        try:
+            claimed_at_epoch = parse_timestamp(claimed_at_str)
+        except ValueError:
+            logger.error(f"Could not parse ClaimedAt timestamp for task ID {record.get('ID')}")
+            return False
+
+        return claimed_at_epoch < cutoff_epoch
     
 
     def mark_task_as_done(self, task: VideoTask):
@@ -119,7 +203,7 @@ class TaskManager:
         """
 
         try:
-            self.client.update_row(
+            self.client.enqueue_row_update(
                 worksheet=self.client.video_tasks_worksheet,
                 row_id=str(task.id),
                 updates={'Status': self.client.config.STATUS_DONE}
@@ -139,7 +223,7 @@ class TaskManager:
         the status to 'pending'.
         """
 
-        is_fatal = any(sub in error_message for sub in self.client.config.fatal_error_substrings)
+        is_fatal = self.client.config.is_fatal_error(error_message)
 
         if task.retry_count >= self.client.config.max_retries or is_fatal:
             try:
@@ -151,7 +235,7 @@ class TaskManager:
         else:
             try:
                 new_retry_count = task.retry_count + 1
-                self.client.update_row(
+                self.client.enqueue_row_update(
                     worksheet=self.client.video_tasks_worksheet,
                     row_id=str(task.id),
                     updates={
@@ -0,0 +1,88 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    A thread-safe token-bucket rate limiter.
+
+    Up to `capacity` calls may be made back to back; after that, calls are
+    spaced to `refill_per_sec` on average. Can be used as a context manager.
+    """
+
+    def __init__(self, capacity: int, refill_per_sec: float):
+        """
+        Initializes a full bucket.
+        """
+
+        if capacity < 1 or refill_per_sec <= 0:
+            raise ValueError("TokenBucket requires capacity >= 1 and refill_per_sec > 0.")
+
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+
+    def _refill(self, now: float):
+        """
+        Adds the tokens accrued since the last refill, up to capacity.
+        """
+
+        # _last_refill lies in the future while paused, so no tokens accrue until the pause ends.
+        elapsed = now - self._last_refill
+        if elapsed <= 0:
+            return
+
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_sec)
+        self._last_refill = now
+
+
+    def acquire(self) -> float:
+        """
+        Blocks until a token is available and consumes it.
+
+        Returns:
+            float: The number of seconds spent waiting.
+        """
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self._paused_until:
+                    sleep_duration = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                else:
+                    sleep_duration = (1 - self._tokens) / self.refill_per_sec
+
+            time.sleep(sleep_duration)
+            waited += sleep_duration
+
+
+    def pause(self, seconds: float):
+        """
+        Drains the bucket and blocks further acquisitions for `seconds`,
+        e.g. when the server answers with a Retry-After header.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = 0.0
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._last_refill = self._paused_until
+
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
@@ -1,7 +1,9 @@
+import functools
 import socket
 
+@functools.lru_cache(maxsize=1)
 def get_machine_hostname() -> str:
     """
-    Retrieves the hostname of the current machine.
+    Retrieves the hostname of the current machine. The result is cached.
     """
     return socket.gethostname()
\ No newline at end of file
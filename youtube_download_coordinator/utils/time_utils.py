@@ -2,6 +2,15 @@ import datetime
 
 def get_current_timestamp() -> str:
     """
-    Generates a timestamp string for the current date and time.
+    Generates a timestamp string for the current date and time, in the
+    "%Y-%m-%d %H:%M:%S" format, without going through strftime.
     """
-    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
\ No newline at end of file
+    now = datetime.datetime.now()
+    return f"{now.year:04d}-{now.month:02d}-{now.day:02d} {now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+
+
+def parse_timestamp(timestamp: str) -> float:
+    """
+    Parses a timestamp produced by get_current_timestamp into epoch seconds.
+    """
+    return datetime.datetime.fromisoformat(timestamp.strip()).timestamp()
\ No newline at end of file
@@ -1,8 +1,18 @@
+import sys
 from dataclasses import dataclass
 from typing import Optional, Dict
 
 
-@dataclass
+# (attribute, sheet column) pairs copied verbatim from a row.
+_TEXT_COLUMNS = (
+    ('claimed_by', 'ClaimedBy'),
+    ('claimed_at', 'ClaimedAt'),
+    ('last_error', 'LastError'),
+)
+
+
+# slots=True is only accepted from Python 3.10 on.
+@dataclass(frozen=True, **({'slots': True} if sys.version_info >= (3, 10) else {}))
 class VideoTask:
     """
     A data class to represent a single video task.
@@ -28,14 +38,16 @@ class VideoTask:
         Creates a VideoTask instance from a dictionary row retrieved from gspread.
         """
 
+        get = data.get
+        duration = get('Duration')
+        retry_count = get('RetryCount')
+
         return cls(
-            id=data.get('ID', ''),
-            source_id=data.get('SourceID', ''),
-            url=data.get('URL', ''),
-            status=data.get('Status', 'pending'),
-            duration=int(data.get('Duration')) if data.get('Duration') is not None else None,
-            claimed_by=data.get('ClaimedBy'),
-            claimed_at=data.get('ClaimedAt'),
-            retry_count=int(data.get('RetryCount', 0)),
-            last_error=data.get('LastError')
-        )
\ No newline at end of file
+            id=get('ID', ''),
+            source_id=get('SourceID', ''),
+            url=get('URL', ''),
+            status=get('Status', 'pending'),
+            duration=int(float(duration)) if duration not in (None, '') else None,
+            retry_count=int(retry_count) if retry_count not in (None, '') else 0,
+            **{attribute: get(column) for attribute, column in _TEXT_COLUMNS}
+        )